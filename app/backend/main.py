@@ -6,7 +6,7 @@ import atexit
 import logging
 import traceback
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from app.backend.security_funded import get_data
 from app.backend.database import db_manager
@@ -115,44 +115,54 @@ def health_check():
             'error': str(e)
         }), 503
 
+def _funding_page(args) -> Dict[str, Any]:
+    """One page of formatted funding data for the pagination/search query args"""
+    params = PaginationParams(
+        page=int(args.get('page', 1)),
+        items_per_page=min(int(args.get('itemsPerPage', Config.DEFAULT_PAGE_SIZE)), Config.MAX_PAGE_SIZE),
+        sort_field=args.get('sortField', 'date'),
+        sort_direction=args.get('sortDirection', 'desc'),
+        search=args.get('search', '').strip() or None,
+        filter_round=args.get('filterRound', '').strip() or None
+    )
+    
+    query = create_query(params.search, params.filter_round)
+    total_count = db_manager.count_documents(query)
+    
+    skip = params.get_skip()
+    total_pages = (total_count + params.items_per_page - 1) // params.items_per_page
+    
+    documents = db_manager.find_with_pagination(
+        query, 
+        params.sort_field, 
+        params.sort_direction, 
+        skip, 
+        params.items_per_page
+    )
+    
+    formatted_data = [format_company_data(doc) for doc in documents]
+    
+    response = PaginatedResponse(
+        data=formatted_data,
+        total_count=total_count,
+        total_pages=total_pages,
+        current_page=params.page,
+        items_per_page=params.items_per_page
+    )
+    return response.to_dict()
+
+def _funding_rounds() -> List[str]:
+    """Sorted distinct non-empty funding rounds"""
+    rounds = db_manager.distinct('round')
+    rounds = [r for r in rounds if r]
+    rounds.sort()
+    return rounds
+
 @app.route('/api/funding-data', methods=['GET'])
 def get_funding_data():
     """API endpoint to fetch paginated funding data"""
     try:
-        params = PaginationParams(
-            page=int(request.args.get('page', 1)),
-            items_per_page=min(int(request.args.get('itemsPerPage', Config.DEFAULT_PAGE_SIZE)), Config.MAX_PAGE_SIZE),
-            sort_field=request.args.get('sortField', 'date'),
-            sort_direction=request.args.get('sortDirection', 'desc'),
-            search=request.args.get('search', '').strip() or None,
-            filter_round=request.args.get('filterRound', '').strip() or None
-        )
-        
-        query = create_query(params.search, params.filter_round)
-        total_count = db_manager.count_documents(query)
-        
-        skip = params.get_skip()
-        total_pages = (total_count + params.items_per_page - 1) // params.items_per_page
-        
-        documents = db_manager.find_with_pagination(
-            query, 
-            params.sort_field, 
-            params.sort_direction, 
-            skip, 
-            params.items_per_page
-        )
-        
-        formatted_data = [format_company_data(doc) for doc in documents]
-        
-        response = PaginatedResponse(
-            data=formatted_data,
-            total_count=total_count,
-            total_pages=total_pages,
-            current_page=params.page,
-            items_per_page=params.items_per_page
-        )
-        
-        return jsonify(response.to_dict()), 200
+        return jsonify(_funding_page(request.args)), 200
         
     except Exception as e:
         logger.error(f"Error fetching funding data: {str(e)}")
@@ -165,11 +175,10 @@ def get_funding_data():
 def get_funding_rounds():
     """API endpoint to get unique funding rounds for filter"""
     try:
-        rounds = db_manager.distinct('round')
-        rounds = [r for r in rounds if r]
-        rounds.sort()
-        
-        return jsonify({'rounds': rounds}), 200
+        # Rounds rarely change; clients revalidate with If-None-Match and usually get an empty 304
+        response = jsonify({'rounds': _funding_rounds()})
+        response.add_etag()
+        return response.make_conditional(request)
         
     except Exception as e:
         logger.error(f"Error fetching funding rounds: {str(e)}")
@@ -199,34 +208,36 @@ def api_get_data():
             "type": "data_collection_error"
         }), 500
 
+def _stats() -> Dict[str, Any]:
+    """Document count, total funding and per-type counts"""
+    total_companies = db_manager.count_documents({})
+    
+    # Optimized aggregation for total funding
+    collection = db_manager.get_collection()
+    pipeline = [
+        {"$group": {"_id": None, "total": {"$sum": "$amount"}}}
+    ]
+    result = list(collection.aggregate(pipeline))
+    total_funding = result[0]['total'] if result else 0
+    
+    # Get funding by type
+    type_pipeline = [
+        {"$group": {"_id": "$company_type", "count": {"$sum": 1}}},
+        {"$sort": {"count": -1}}
+    ]
+    type_stats = list(collection.aggregate(type_pipeline))
+    
+    return {
+        'total_companies': total_companies,
+        'total_funding': total_funding,
+        'funding_by_type': type_stats
+    }
+
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """API endpoint to get database statistics"""
     try:
-        total_companies = db_manager.count_documents({})
-        
-        # Optimized aggregation for total funding
-        collection = db_manager.get_collection()
-        pipeline = [
-            {"$group": {"_id": None, "total": {"$sum": "$amount"}}}
-        ]
-        result = list(collection.aggregate(pipeline))
-        total_funding = result[0]['total'] if result else 0
-        
-        # Get funding by type
-        type_pipeline = [
-            {"$group": {"_id": "$company_type", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}}
-        ]
-        type_stats = list(collection.aggregate(type_pipeline))
-        
-        stats = {
-            'total_companies': total_companies,
-            'total_funding': total_funding,
-            'funding_by_type': type_stats
-        }
-        
-        return jsonify(stats), 200
+        return jsonify(_stats()), 200
         
     except Exception as e:
         logger.error(f"Error fetching stats: {str(e)}")
@@ -235,6 +246,23 @@ def get_stats():
             'type': 'stats_error'
         }), 500
 
+@app.route('/api/bootstrap', methods=['GET'])
+def get_bootstrap():
+    """API endpoint returning stats, funding rounds and one page of funding data for the initial page load"""
+    try:
+        return jsonify({
+            'stats': _stats(),
+            'rounds': _funding_rounds(),
+            'funding': _funding_page(request.args)
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error fetching bootstrap data: {str(e)}")
+        return jsonify({
+            'error': str(e),
+            'type': 'bootstrap_error'
+        }), 500
+
 @app.route('/api/debug', methods=['GET'])
 def debug_info():
     """Debug endpoint for troubleshooting"""
@@ -1,172 +1,252 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
 import html
-from typing import List, Dict, Any
-from datetime import datetime
+import re
+from urllib.parse import quote
+from string import Template
+from functools import lru_cache
+from typing import List, Dict, Any, NamedTuple, Tuple
 from bs4 import BeautifulSoup
-from app.frontend.utils.formatters import format_amount, format_date, get_round_color
+from app.frontend.utils.formatters import format_amount, format_amount_series, format_date, get_round_color, get_round_style
+
+# libxml2-backed parsing is several times faster; html.parser keeps things working without the lxml wheel
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Tag-shaped tokens only, so comparisons like 'a < b and c > d' survive
+_TAG_RE = re.compile(r'</?[A-Za-z][^>]*>')
+_WS_RE = re.compile(r'\s+')
+
+def _unescape(text: str) -> str:
+    """Resolve up to three levels of nested HTML entity encoding"""
+    # Stop as soon as a pass changes nothing; most text is encoded once or not at all
+    for _ in range(3):
+        if '&' not in text:
+            break
+        unescaped = html.unescape(text)
+        if unescaped == text:
+            break
+        text = unescaped
+    return text
+
+def _truncate(text: str) -> str:
+    """Limit display text to 200 characters"""
+    return text[:197] + '...' if len(text) > 200 else text
 
 def clean_html_text(text: str) -> str:
     """Clean and truncate HTML text efficiently"""
     if not text:
         return ""
+    # Normalized to str first so unhashable input cannot reach the cache
+    return _clean_html(str(text))
+
+@lru_cache(maxsize=4096)
+def _clean_html(text: str) -> str:
+    # Plain text (no tags, no entities) needs no parser; only whitespace and length are normalized
+    if '<' not in text and '&' not in text:
+        return _truncate(_WS_RE.sub(' ', text).strip())
+
+    processed_text = _unescape(text)
     
-    processed_text = str(text)
-    for _ in range(3):
-        processed_text = html.unescape(processed_text)
-    
-    soup = BeautifulSoup(processed_text, 'html.parser')
+    soup = BeautifulSoup(processed_text, _HTML_PARSER)
     for script_or_style in soup(["script", "style"]):
         script_or_style.decompose()
     
-    plain_text = soup.get_text()
-    lines = (line.strip() for line in plain_text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    cleaned_text = ' '.join(chunk for chunk in chunks if chunk)
-    cleaned_text = cleaned_text.strip()
-    
-    if len(cleaned_text) > 200:
-        cleaned_text = cleaned_text[:197] + '...'
-    return cleaned_text
+    return _truncate(_WS_RE.sub(' ', soup.get_text()).strip())
 
-def display_funding_card(company: Dict[str, Any]):
-    """Display optimized funding card with enhanced styling"""
-    
-    company_name = clean_html_text(str(company.get('company_name', 'Unknown Company')))
-    
+@lru_cache(maxsize=4096)
+def _clean_short_text(text: str) -> str:
+    """Clean a short label (name, round, type, source) without building a DOM; callers pass str"""
+    if not text:
+        return ""
+    # Labels never carry <script>/<style> blocks, so stripping tags is enough; descriptions use clean_html_text.
+    # Tags go before entities are decoded: an encoded "&lt;Series A&gt;" is part of the label, not markup
+    cleaned_text = _unescape(_TAG_RE.sub('', text))
+    return _truncate(_WS_RE.sub(' ', cleaned_text).strip())
+
+MAX_LINK_INVESTORS = 3
+
+# Reserved URL characters left as-is; anything else unsafe (quotes, <, >, spaces) is percent-encoded
+_URL_SAFE_CHARS = ":/?&=#%+,;@"
+_is_http_url = re.compile(r'https?://').match
+
+def _safe_url(url: Any) -> str:
+    """Return an http(s) URL percent-encoded for an href, or '' if it is not one"""
+    url = str(url or '').strip()
+    if not _is_http_url(url):
+        return ''
+    return quote(url, safe=_URL_SAFE_CHARS)
+
+class _CardData(NamedTuple):
+    """All display strings for one funding card, derived in a single pass"""
+    company_name: str
+    round_name: str
+    round_style: Tuple[str, str, str]
+    amount: str
+    date: str
+    description: str
+    company_type: str
+    source: str
+    investors: Tuple[Tuple[str, str], ...]
+    more_investors: int
+    company_url: str
+    story_link: str
+
+def _card_data(company: Dict[str, Any]) -> _CardData:
+    """Project a company dict onto the fields a funding card displays"""
     raw_round_data = company.get('round')
     round_name_raw_for_logic = "Unknown" if not raw_round_data else str(raw_round_data)
-    round_name_display = clean_html_text(round_name_raw_for_logic)
-    
-    date_str = format_date(company.get('date', ''))
-    company_type = clean_html_text(str(company.get('company_type', 'Unknown')))
-    description = clean_html_text(str(company.get('description', '')))
+    round_name_display = _clean_short_text(round_name_raw_for_logic)
+    has_round = bool(round_name_display) and round_name_display.lower() != 'unknown'
 
     raw_source = company.get('source')
-    source_display_text = clean_html_text(str(raw_source)) if raw_source else "ReturnonSecurity"
-
-    amount_display = format_amount(company.get('amount', 0))
 
     investors_raw = company.get('investors', [])
-    MAX_LINK_INVESTORS = 3
-    linked_investors_data = []
-
-    if isinstance(investors_raw, list):
-        for inv_data in investors_raw[:MAX_LINK_INVESTORS]:
-            investor_name = ''
-            investor_url = ''
-            if isinstance(inv_data, dict):
-                investor_name = clean_html_text(str(inv_data.get('name', '')))
-                investor_url_raw = str(inv_data.get('url', ''))
-                if investor_url_raw and (investor_url_raw.startswith('http://') or investor_url_raw.startswith('https://')):
-                    investor_url = investor_url_raw
-            elif isinstance(inv_data, str):
-                investor_name = clean_html_text(inv_data)
-            if investor_name:
-                linked_investors_data.append({'name': investor_name, 'url': investor_url})
-
-    num_total_investors = len(investors_raw) if isinstance(investors_raw, list) else 0
-    more_investors_count = num_total_investors - len(linked_investors_data)
-
-    company_url = str(company.get('company_url', ''))
-    story_link = str(company.get('story_link', ''))
-    if not (company_url.startswith('http://') or company_url.startswith('https://')): 
-        company_url = ''
-    if not (story_link.startswith('http://') or story_link.startswith('https://')): 
-        story_link = ''
-    
-    round_color_key = round_name_raw_for_logic if round_name_display and round_name_display.lower() != 'unknown' else "Unknown"
-    round_color = get_round_color(round_color_key)
+    if not isinstance(investors_raw, list):
+        investors_raw = ()
+    num_total_investors = len(investors_raw)
+    linked_investors = []
+    for inv_data in investors_raw[:MAX_LINK_INVESTORS]:
+        investor_name = ''
+        investor_url = ''
+        if isinstance(inv_data, dict):
+            investor_name = _clean_short_text(str(inv_data.get('name', '')))
+            investor_url = _safe_url(inv_data.get('url'))
+        elif isinstance(inv_data, str):
+            investor_name = _clean_short_text(inv_data)
+        if investor_name:
+            linked_investors.append((investor_name, investor_url))
 
-    try:
-        card_container = st.container(border=True)
-    except TypeError:
-        card_container = st.container()
-
-    with card_container:
-        header_col1, header_col2 = st.columns([0.7, 0.3])
-        with header_col1:
-            st.subheader(company_name)
-            
-            if round_name_display and round_name_display.lower() != 'unknown':
-                badge_html = f"""<span style="display: inline-block; padding: 0.2rem 0.5rem;
-                                            background-color: {round_color}20; border: 1px solid {round_color}40;
-                                            color: {round_color}; border-radius: 6px; font-size: 0.86rem;
-                                            font-weight: 500; margin-top: -5px; margin-bottom: 10px;">
-                                   {html.escape(round_name_display)}
-                               </span>"""
-                st.markdown(badge_html, unsafe_allow_html=True)
-            else:
-                st.markdown("<div style='height: 1px; margin-top: -5px; margin-bottom: 10px; visibility: hidden;'></div>", unsafe_allow_html=True)
-
-        with header_col2:
-            amount_font_size = "1.4rem" if amount_display != "Undisclosed" else "1.19rem"
-            amount_color = "#10b981" if amount_display != "Undisclosed" else "gold"
-            
-            st.markdown(f"<div style='text-align: right;'>"
-                        f"<p style='font-size: {amount_font_size}; font-weight: bold; color: {amount_color}; margin-bottom: -2px; line-height:1.2;'>{html.escape(amount_display)}</p>"
-                        f"<p style='font-size: 0.75rem; color: #6b7280; margin-top: 0px;'>{html.escape(date_str)}</p>"
-                        f"</div>", unsafe_allow_html=True)
-        
-        description_text = description if description else " "
-        st.markdown(f"<p style='color: #9ca3af; font-size: 0.875rem; line-height: 1.6; min-height: 3.2em; max-height: 3.2em; display: -webkit-box; -webkit-line-clamp: 2; -webkit-box-orient: vertical; overflow: hidden; text-overflow: ellipsis; margin-bottom: 0.75rem;'>{description_text}</p>", unsafe_allow_html=True)
-
-        type_tag_html = f"""<span style='background-color: #262626; color: #a3a3a3; 
-                                        padding: 0.25rem 0.5rem; border-radius: 4px; 
-                                        border: 1px solid #4B5563;'>
-                               Type: {html.escape(company_type if company_type else 'N/A')}
-                           </span>"""
-        st.markdown(f"<div style='display: flex; gap: 0.5rem; margin-bottom: 0.75rem; flex-wrap: wrap; font-size: 0.75rem; min-height: 1.8em;'>{type_tag_html}</div>", unsafe_allow_html=True)
-
-        if num_total_investors > 0:
-            investor_links_html = []
-            link_style = "text-decoration: none; padding: 0.15rem 0.4rem; border-radius: 4px; font-size: 0.75rem; margin-right: 0.3rem; margin-bottom: 0.3rem; display: inline-block;"
-            
-            for inv in linked_investors_data:
-                if inv['url']:
-                    style = f"{link_style} color: #90cdf4; background-color: #2d3748; border: 1px solid #4a5568;"
-                    investor_links_html.append(f"<a href='{html.escape(inv['url'])}' target='_blank' rel='noopener noreferrer' style='{style}'>{html.escape(inv['name'])}</a>")
-                else:
-                    style = f"{link_style} color: #a0aec0; background-color: #384252; border: 1px solid #4a5568; cursor: default;"
-                    investor_links_html.append(f"<span style='{style}'>{html.escape(inv['name'])}</span>")
-            
-            investor_content = "".join(investor_links_html)
-            if more_investors_count > 0:
-                investor_content += f"<span style='font-size: 0.75rem; color: #a3a3a3; margin-left: 0.3rem; display: inline-block; vertical-align: middle; margin-bottom: 0.3rem;'>+{more_investors_count} more</span>"
-            
-            st.markdown(f"""
-            <div style="margin-bottom: 0.5rem; min-height: 2.8em;">
-                <strong style='font-size:0.8rem; color: #8a8a8a; margin-bottom: 0.25rem; display: block;'>Investors:</strong>
-                <div style='line-height: 1.5;'>{investor_content}</div>
-            </div>""", unsafe_allow_html=True)
-        else:
-            st.markdown(f"<div style='margin-bottom: 0.5rem; min-height: 2.8em;'> </div>", unsafe_allow_html=True)
-
-        st.markdown(f"""
-        <div style='margin-bottom:1rem; min-height: 1.5em;'>
-            <span style='font-size:0.75rem; color: #6b7280;'>Source: {html.escape(source_display_text)}</span>
-        </div>""", unsafe_allow_html=True)
-        
-        button_cols = st.columns(2)
-        button_style = ("text-decoration: none; display: block; width: 100%; text-align: center; "
-                       "padding: 0.35rem 0.75rem; font-size: 0.875rem; border-radius: 0.375rem; "
-                       "font-weight: 500; line-height: 1.25; ")
-
-        enabled_style = f"{button_style}color: #FAFAFA; background-color: #31333F; border: 1px solid #31333F; cursor: pointer;"
-        disabled_style = f"{button_style}color: rgba(250, 250, 250, 0.5); background-color: rgba(49, 51, 63, 0.4); border: 1px solid rgba(49, 51, 63, 0.4); cursor: not-allowed;"
-
-        with button_cols[0]:
-            if company_url:
-                st.markdown(f'<a href="{html.escape(company_url)}" target="_blank" rel="noopener noreferrer" style="{enabled_style}">🔗 Website</a>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<span style="{disabled_style}">🔗 Website</span>', unsafe_allow_html=True)
-
-        with button_cols[1]:
-            if story_link:
-                st.markdown(f'<a href="{html.escape(story_link)}" target="_blank" rel="noopener noreferrer" style="{enabled_style}">📰 Story</a>', unsafe_allow_html=True)
-            else:
-                st.markdown(f'<span style="{disabled_style}">📰 Story</span>', unsafe_allow_html=True)
+    return _CardData(
+        company_name=_clean_short_text(str(company.get('company_name', 'Unknown Company'))),
+        round_name=round_name_display if has_round else '',
+        round_style=get_round_style(round_name_raw_for_logic if has_round else "Unknown"),
+        amount=format_amount(company.get('amount', 0)),
+        date=format_date(company.get('date', '')),
+        description=clean_html_text(str(company.get('description', ''))),
+        company_type=_clean_short_text(str(company.get('company_type', 'Unknown'))),
+        source=_clean_short_text(str(raw_source)) if raw_source else "ReturnonSecurity",
+        investors=tuple(linked_investors),
+        more_investors=num_total_investors - len(linked_investors),
+        company_url=_safe_url(company.get('company_url')),
+        story_link=_safe_url(company.get('story_link')),
+    )
+
+
+# Card styling, sent once per page of cards; each card only carries class names and its round colours
+_CARD_CSS = ("<style>"
+             ".funding-card-grid { display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 1rem; align-items: stretch; }"
+             " @media (max-width: 640px) { .funding-card-grid { grid-template-columns: minmax(0, 1fr); } }"
+             " .fc-card { border: 1px solid rgba(250, 250, 250, 0.2); border-radius: 0.5rem; padding: calc(1em - 1px); }"
+             " .fc-header { display: flex; gap: 1rem; }"
+             " .fc-title { flex: 0 0 70%; min-width: 0; }"
+             " .fc-name { font-size: 1.5rem; font-weight: 600; line-height: 1.2; color: #FAFAFA; margin-bottom: 0.25rem; }"
+             " .fc-badge { display: inline-block; padding: 0.2rem 0.5rem; background-color: var(--round-fill); border: 1px solid var(--round-border);"
+             " color: var(--round-color); border-radius: 6px; font-size: 0.86rem; font-weight: 500; margin-top: -5px; margin-bottom: 10px; }"
+             " .fc-no-badge { height: 1px; margin-top: -5px; margin-bottom: 10px; visibility: hidden; }"
+             " .fc-amount { flex: 1 1 auto; text-align: right; }"
+             " .fc-amount p:first-child { font-size: 1.4rem; font-weight: bold; color: #10b981; margin-bottom: -2px; line-height: 1.2; }"
+             " .fc-amount.fc-undisclosed p:first-child { font-size: 1.19rem; color: gold; }"
+             " .fc-date { font-size: 0.75rem; color: #6b7280; margin-top: 0px; }"
+             " .fc-description { color: #9ca3af; font-size: 0.875rem; line-height: 1.6; min-height: 3.2em; max-height: 3.2em; display: -webkit-box;"
+             " -webkit-line-clamp: 2; -webkit-box-orient: vertical; overflow: hidden; text-overflow: ellipsis; margin-bottom: 0.75rem; }"
+             " .fc-tags { display: flex; gap: 0.5rem; margin-bottom: 0.75rem; flex-wrap: wrap; font-size: 0.75rem; min-height: 1.8em; }"
+             " .fc-tag { background-color: #262626; color: #a3a3a3; padding: 0.25rem 0.5rem; border-radius: 4px; border: 1px solid #4B5563; }"
+             " .fc-investors { margin-bottom: 0.5rem; min-height: 2.8em; }"
+             " .fc-investors strong { font-size: 0.8rem; color: #8a8a8a; margin-bottom: 0.25rem; display: block; }"
+             " .fc-investors div { line-height: 1.5; }"
+             " .fc-investor { text-decoration: none; padding: 0.15rem 0.4rem; border-radius: 4px; font-size: 0.75rem; margin-right: 0.3rem;"
+             " margin-bottom: 0.3rem; display: inline-block; border: 1px solid #4a5568; }"
+             " a.fc-investor { color: #90cdf4; background-color: #2d3748; }"
+             " span.fc-investor { color: #a0aec0; background-color: #384252; cursor: default; }"
+             " .fc-more { font-size: 0.75rem; color: #a3a3a3; margin-left: 0.3rem; display: inline-block; vertical-align: middle; margin-bottom: 0.3rem; }"
+             " .fc-source { margin-bottom: 1rem; min-height: 1.5em; font-size: 0.75rem; color: #6b7280; }"
+             " .fc-buttons { display: flex; gap: 1rem; }"
+             " .fc-buttons > * { flex: 1; text-decoration: none; display: block; text-align: center; padding: 0.35rem 0.75rem; font-size: 0.875rem;"
+             " border-radius: 0.375rem; font-weight: 500; line-height: 1.25; }"
+             " a.fc-button { color: #FAFAFA; background-color: #31333F; border: 1px solid #31333F; cursor: pointer; }"
+             " a.fc-button:hover { filter: brightness(1.2); }"
+             " span.fc-button { color: rgba(250, 250, 250, 0.5); background-color: rgba(49, 51, 63, 0.4); border: 1px solid rgba(49, 51, 63, 0.4); cursor: not-allowed; }"
+             "</style>")
+
+# Card markup, compiled once; only the per-company values are substituted at render time
+_BADGE_TEMPLATE = Template("<span class='fc-badge' style='--round-color: $color; --round-fill: $fill; --round-border: $border;'>$name</span>")
+_NO_BADGE_HTML = "<div class='fc-no-badge'></div>"
+_AMOUNT_TEMPLATE = Template("<div class='$amount_class'><p>$amount</p><p class='fc-date'>$date</p></div>")
+_DESCRIPTION_TEMPLATE = Template("<p class='fc-description'>$description</p>")
+_TYPE_TAG_TEMPLATE = Template("<div class='fc-tags'><span class='fc-tag'>Type: $company_type</span></div>")
+_INVESTOR_LINK_TEMPLATE = Template("<a class='fc-investor' href='$url' target='_blank' rel='noopener noreferrer'>$name</a>")
+_INVESTOR_SPAN_TEMPLATE = Template("<span class='fc-investor'>$name</span>")
+_MORE_INVESTORS_TEMPLATE = Template("<span class='fc-more'>+$count more</span>")
+_KEY_INVESTORS_TEMPLATE = Template("<div class='fc-investors'><strong>Investors:</strong><div>$investors</div></div>")
+_NO_INVESTORS_HTML = "<div class='fc-investors'> </div>"
+_SOURCE_TEMPLATE = Template("<div class='fc-source'>Source: $source</div>")
+_WEBSITE_BTN_TEMPLATE = Template("<a class='fc-button' href='$url' target='_blank' rel='noopener noreferrer'>🔗 Website</a>")
+_STORY_BTN_TEMPLATE = Template("<a class='fc-button' href='$url' target='_blank' rel='noopener noreferrer'>📰 Story</a>")
+_NO_WEBSITE_HTML = "<span class='fc-button'>🔗 Website</span>"
+_NO_STORY_HTML = "<span class='fc-button'>📰 Story</span>"
+
+# Grid wrapper and per-card frame that replace st.columns / st.container(border=True)
+_CARD_GRID_TEMPLATE = Template(f"{_CARD_CSS}<div class='funding-card-grid'>$cards</div>")
+_CARD_TEMPLATE = Template("<div class='fc-card'>"
+                          "<div class='fc-header'><div class='fc-title'><div class='fc-name'>$company_name</div>$badge</div>$amount</div>"
+                          "$description$type_tag$investors$source"
+                          "<div class='fc-buttons'>$website$story</div>"
+                          "</div>")
+
+def _build_card_html(card: _CardData) -> str:
+    """Build the complete HTML for a projected funding card"""
+    (company_name, round_name_display, round_style, amount_display, date_str, description,
+     company_type, source_display_text, investors, more_investors_count, company_url, story_link) = card
+
+    if round_name_display:
+        round_color, round_fill, round_border = round_style
+        badge_html = _BADGE_TEMPLATE.substitute(color=round_color, fill=round_fill, border=round_border,
+                                                name=html.escape(round_name_display))
+    else:
+        badge_html = _NO_BADGE_HTML
+
+    amount_html = _AMOUNT_TEMPLATE.substitute(
+        amount_class="fc-amount" if amount_display != "Undisclosed" else "fc-amount fc-undisclosed",
+        amount=html.escape(amount_display),
+        date=html.escape(date_str))
+
+    if investors or more_investors_count > 0:
+        investor_links_html = [
+            _INVESTOR_LINK_TEMPLATE.substitute(url=html.escape(investor_url), name=html.escape(investor_name))
+            if investor_url else _INVESTOR_SPAN_TEMPLATE.substitute(name=html.escape(investor_name))
+            for investor_name, investor_url in investors
+        ]
+        if more_investors_count > 0:
+            investor_links_html.append(_MORE_INVESTORS_TEMPLATE.substitute(count=more_investors_count))
+        investors_html = _KEY_INVESTORS_TEMPLATE.substitute(investors="".join(investor_links_html))
+    else:
+        investors_html = _NO_INVESTORS_HTML
+
+    return _CARD_TEMPLATE.substitute(
+        company_name=html.escape(company_name),
+        badge=badge_html,
+        amount=amount_html,
+        description=_DESCRIPTION_TEMPLATE.substitute(description=description or " "),
+        type_tag=_TYPE_TAG_TEMPLATE.substitute(company_type=html.escape(company_type or 'N/A')),
+        investors=investors_html,
+        source=_SOURCE_TEMPLATE.substitute(source=html.escape(source_display_text)),
+        website=_WEBSITE_BTN_TEMPLATE.substitute(url=html.escape(company_url)) if company_url else _NO_WEBSITE_HTML,
+        story=_STORY_BTN_TEMPLATE.substitute(url=html.escape(story_link)) if story_link else _NO_STORY_HTML,
+    )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _render_cards_html(companies: List[Dict[str, Any]]) -> str:
+    """Build the concatenated card HTML for a page of companies"""
+    return "".join([_build_card_html(_card_data(c)) for c in companies])
+
+def display_funding_card(company: Dict[str, Any]):
+    """Display optimized funding card with enhanced styling"""
+    st.html(_CARD_CSS + _build_card_html(_card_data(company)))
 
 def display_funding_cards(companies: List[Dict[str, Any]]):
     """Display funding cards in optimized grid layout"""
@@ -174,24 +254,32 @@ def display_funding_cards(companies: List[Dict[str, Any]]):
         st.info("No funding data found. Try adjusting your search criteria.")
         return
     
-    num_columns = 3 
-    for i in range(0, len(companies), num_columns):
-        cols = st.columns(num_columns)
-        for j in range(num_columns):
-            if i + j < len(companies):
-                with cols[j]:
-                    display_funding_card(companies[i + j])
+    # One HTML element for the whole page of cards instead of columns + ~10 elements per card
+    st.html(_CARD_GRID_TEMPLATE.substitute(cards=_render_cards_html(companies)))
 
-def display_no_data_message():
-    """Display professional no data message"""
-    st.markdown("""
+# Shown while a page is fetched; same grid and card frame as the real cards, so swapping them in does not shift the layout
+_SKELETON_CSS = ("<style>"
+                 "@keyframes fc-shimmer { 0%, 100% { opacity: 0.45; } 50% { opacity: 0.9; } }"
+                 " .fc-skeleton { height: 18rem; background-color: #1a1a1a; animation: fc-shimmer 1.4s ease-in-out infinite; }"
+                 "</style>")
+_SKELETON_GRID_HTML = _CARD_GRID_TEMPLATE.substitute(cards="<div class='fc-card fc-skeleton'></div>" * 12) + _SKELETON_CSS
+
+def display_loading_cards():
+    """Display placeholder cards while funding data loads"""
+    st.html(_SKELETON_GRID_HTML)
+
+_NO_DATA_HTML = """
     <div style="background-color: #111111; border: 1px solid #333333; border-radius: 12px; 
                  padding: 3rem 2rem; text-align: center; margin: 2rem 0;">
         <div style="font-size: 3rem; margin-bottom: 1rem;">🤷‍♂️</div>
         <h3 style="color: #e0e0e0; font-size: 1.3rem; margin-bottom: 0.5rem;">No Funding Data Found</h3>
         <p style="color: #9e9e9e; font-size: 0.9rem;">Try adjusting your search criteria or check back later.</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def display_no_data_message():
+    """Display professional no data message"""
+    st.html(_NO_DATA_HTML)
 
 def display_funding_data(companies: List[Dict[str, Any]], view_mode: str = "cards"):
     """Display funding data in specified view mode"""
@@ -200,16 +288,6 @@ def display_funding_data(companies: List[Dict[str, Any]], view_mode: str = "card
         return
 
     if view_mode == "cards":
-        st.markdown("""
-            <style>
-            a[style*="cursor: pointer;"]:hover {
-                filter: brightness(1.2);
-            }
-            div[data-testid="stVerticalBlock"] div[data-testid="stVerticalBlock"] div[data-testid="stMarkdownContainer"] h3 {
-                margin-bottom: 0.25rem !important; 
-            }
-            </style>
-            """, unsafe_allow_html=True)
         display_funding_cards(companies)
     elif view_mode == "table":
         if not companies: 
@@ -219,63 +297,113 @@ def display_funding_data(companies: List[Dict[str, Any]], view_mode: str = "card
     elif view_mode == "chart":
         display_chart_view(companies) 
 
+_TABLE_COLUMN_CONFIG = {
+    "Company": st.column_config.TextColumn("🏢 Company", width="large"),
+    "Round": st.column_config.TextColumn("💼 Round"),
+    "Amount": st.column_config.TextColumn("💰 Amount"),
+    "Type": st.column_config.TextColumn("🏷️ Type", width="small"),
+    "Date": st.column_config.TextColumn("📅 Date"),
+    "Investors": st.column_config.NumberColumn("👥 Investors", width="small"),
+    "Source": st.column_config.TextColumn("🌐 Source")
+}
+
+_HTML_TABLE_MAX_ROWS = 200
+_TABLE_HEADERS = {name: config["label"] for name, config in _TABLE_COLUMN_CONFIG.items()}
+_TABLE_CSS = ("<style>"
+              ".funding-tbl { width: 100%; border-collapse: collapse; font-size: 0.875rem; color: #FAFAFA; }"
+              " .funding-tbl th { text-align: left; padding: 0.5rem; color: #9ca3af; font-weight: 500; border-bottom: 1px solid rgba(250, 250, 250, 0.2); }"
+              " .funding-tbl td { padding: 0.5rem; border-bottom: 1px solid rgba(250, 250, 250, 0.1); }"
+              " .funding-tbl tr:hover td { background-color: #1f2937; }"
+              "</style>")
+
+_TABLE_SOURCE_FIELDS = ['company_name', 'round', 'amount', 'company_type', 'date', 'investors', 'source']
+
+def _clean_column(values: pd.Series, default: str) -> pd.Series:
+    """Clean a text column, running _clean_short_text once per distinct value"""
+    values = values.fillna(default).astype(str)
+    return values.map({v: _clean_short_text(v) for v in values.unique()})
+
+def _source_column(values: pd.Series) -> pd.Series:
+    """Clean the source column, showing ReturnonSecurity where it is missing or blank"""
+    source = _clean_column(values.where(values.astype(bool), None), '')
+    return source.mask(source == '', "ReturnonSecurity")
+
+def _table_frame(companies: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build the display table column by column from the raw company records"""
+    raw = pd.DataFrame.from_records(companies, columns=_TABLE_SOURCE_FIELDS)
+    return pd.DataFrame({
+        "Company": _clean_column(raw['company_name'], 'Unknown'),
+        "Round": _clean_column(raw['round'], 'Unknown'),
+        "Amount": format_amount_series(raw['amount']),
+        "Type": _clean_column(raw['company_type'], 'Unknown'),
+        "Date": raw['date'].fillna('').map(format_date),
+        "Investors": raw['investors'].map(lambda v: len(v) if isinstance(v, list) else 0),
+        "Source": _source_column(raw['source']),
+    })
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _table_csv(df: pd.DataFrame) -> bytes:
+    """Serialize the display table for the CSV download"""
+    return df.to_csv(index=False).encode('utf-8')
+
 def display_table_view(companies: List[Dict[str, Any]]):
     """Display optimized table view"""
-    st.markdown("<h3 style='color: #8b5cf6; font-size: 1.5rem; margin-bottom: 1rem;'>📊 Funding Table</h3>", unsafe_allow_html=True)
-    
-    table_data = [{
-        "Company": clean_html_text(str(c.get('company_name', 'Unknown'))),
-        "Round": clean_html_text(str(c.get('round', 'Unknown'))),
-        "Amount": format_amount(c.get('amount', 0)),
-        "Type": clean_html_text(str(c.get('company_type', 'Unknown'))),
-        "Date": format_date(c.get('date', '')),
-        "Investors": len(c.get('investors', []) if isinstance(c.get('investors'), list) else []),
-        "Source": clean_html_text(str(c.get('source', ''))) if c.get('source') and clean_html_text(str(c.get('source', ''))) else "ReturnonSecurity"
-    } for c in companies]
+    st.html("<h3 style='color: #8b5cf6; font-size: 1.5rem; margin-bottom: 1rem;'>📊 Funding Table</h3>")
     
-    df = pd.DataFrame(table_data)
-    st.dataframe(df, use_container_width=True, hide_index=True, column_config={
-        "Company": st.column_config.TextColumn("🏢 Company", width="large"),
-        "Round": st.column_config.TextColumn("💼 Round"),
-        "Amount": st.column_config.TextColumn("💰 Amount"),
-        "Type": st.column_config.TextColumn("🏷️ Type", width="small"),
-        "Date": st.column_config.TextColumn("📅 Date"),
-        "Investors": st.column_config.NumberColumn("👥 Investors", width="small"),
-        "Source": st.column_config.TextColumn("🌐 Source")
-    }) 
+    df = _table_frame(companies)
+    if len(df) <= _HTML_TABLE_MAX_ROWS:
+        # Small result sets render as static HTML, skipping Arrow serialization of the frame
+        st.html(_TABLE_CSS + df.rename(columns=_TABLE_HEADERS).to_html(index=False, border=0, classes='funding-tbl'))
+    else:
+        st.dataframe(df, use_container_width=True, hide_index=True, column_config=_TABLE_COLUMN_CONFIG) 
     
     try:
-        csv = df.to_csv(index=False).encode('utf-8')
-        st.download_button(label="📥 Download CSV", data=csv, file_name="funding_data.csv", mime="text/csv", use_container_width=True)
+        st.download_button(label="📥 Download CSV", data=_table_csv(df), file_name="funding_data.csv", mime="text/csv", use_container_width=True)
     except Exception as e: 
         st.error(f"Could not generate CSV: {e}")
 
+_CHART_SOURCE_FIELDS = ['company_name', 'round', 'company_type', 'source', 'amount', 'date']
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _chart_frame(companies: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build the cleaned DataFrame the analytics charts aggregate over"""
+    raw = pd.DataFrame.from_records(companies, columns=_CHART_SOURCE_FIELDS)
+    # Low-cardinality labels become categoricals so groupby/value_counts work on integer codes
+    return pd.DataFrame({
+        'company_name': _clean_column(raw['company_name'], ''),
+        'round': _clean_column(raw['round'], 'Unknown').replace('', 'Unknown').astype('category'),
+        'company_type': _clean_column(raw['company_type'], 'Unknown').astype('category'),
+        'source': _source_column(raw['source']).astype('category'),
+        'amount': pd.to_numeric(raw['amount'], errors='coerce').fillna(0),
+        'date': raw['date'],
+    })
+
 def display_chart_view(companies: List[Dict[str, Any]]):
     """Display optimized chart analytics"""
-    st.markdown("<h3 style='color: #8b5cf6; font-size: 1.5rem; margin-bottom: 1rem;'>📈 Funding Analytics</h3>", unsafe_allow_html=True)
+    st.html("<h3 style='color: #8b5cf6; font-size: 1.5rem; margin-bottom: 1rem;'>📈 Funding Analytics</h3>")
     if not companies: 
         st.info("No data available to display charts.")
         return
 
-    df_data = [{
-        'company_name': clean_html_text(str(c.get('company_name', ''))),
-        'round': clean_html_text(str(c.get('round', 'Unknown'))),
-        'company_type': clean_html_text(str(c.get('company_type', 'Unknown'))),
-        'source': clean_html_text(str(c.get('source', ''))) if c.get('source') and clean_html_text(str(c.get('source', ''))) else "ReturnonSecurity",
-        'amount': c.get('amount', 0), 
-        'date': c.get('date')
-    } for c in companies]
-    
-    df = pd.DataFrame(df_data)
-    df['amount'] = pd.to_numeric(df['amount'], errors='coerce').fillna(0)
-    df['company_type'] = df['company_type'].fillna('Unknown')
-    df['round'] = df['round'].replace('', 'Unknown')
+    # Built once and shared by every chart; the figure builders only read column slices
+    _chart_panel(_chart_frame(companies))
 
-    tab1, tab2, tab3, tab4 = st.tabs(["💰 By Round", "📊 Distribution", "📅 Timeline", "🏢 By Type"])
-    with tab1: display_funding_by_round_chart(df.copy())
-    with tab2: display_amount_distribution_chart(df.copy())
-    with tab3: display_funding_timeline_chart(df.copy())
-    with tab4: display_funding_by_type_chart(df.copy())
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_round_figure(df: pd.DataFrame):
+    """Build the funding-by-round bar chart, or None if nothing is disclosed"""
+    # Plotly is imported on first chart build so card and table reruns never pay for it
+    import plotly.express as px
+    df_agg = df.groupby('round', as_index=False, observed=True).agg(Total_Amount=('amount', 'sum'))
+    df_agg = df_agg[df_agg['Total_Amount'] > 0].sort_values('Total_Amount', ascending=False)
+    if df_agg.empty:
+        return None
+    
+    # Bars take the same colours as the round badges on the cards, resolved once per distinct round
+    round_colors = {name: get_round_color(name) for name in df_agg['round']}
+    fig = px.bar(df_agg, x='round', y='Total_Amount', title='Total Funding by Round', 
+                 color='round', color_discrete_map=round_colors)
+    fig.update_layout(plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font_color='#FAFAFA', title_x=0.5, showlegend=False)
+    return fig
 
 def display_funding_by_round_chart(df: pd.DataFrame):
     """Display funding by round chart"""
@@ -283,79 +411,123 @@ def display_funding_by_round_chart(df: pd.DataFrame):
         st.caption("Insufficient data for 'Funding by Round' chart.")
         return
     
-    df_agg = df.groupby('round', as_index=False).agg(Total_Amount=('amount', 'sum'))
-    df_agg = df_agg[df_agg['Total_Amount'] > 0].sort_values('Total_Amount', ascending=False)
-    
-    if df_agg.empty: 
+    fig = _build_round_figure(df[['round', 'amount']])
+    if fig is None: 
         st.caption("No disclosed funding amounts by round.")
         return
-    
-    fig = px.bar(df_agg, x='round', y='Total_Amount', title='Total Funding by Round', 
-                 color='Total_Amount', color_continuous_scale=px.colors.sequential.Viridis)
-    fig.update_layout(plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font_color='#FAFAFA', title_x=0.5)
     st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_distribution_figure(df: pd.DataFrame):
+    """Build the amount histogram, or None if no amount exceeds $1K"""
+    import plotly.graph_objects as go
+    amounts = df['amount'].to_numpy(dtype=float)
+    amounts = amounts[amounts > 1000]
+    if amounts.size == 0:
+        return None
+    
+    # Bin server-side so only the bin counts are sent to the browser, not every amount
+    counts, edges = np.histogram(amounts, bins=30)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges),
+                           marker_color='#636EFA'))
+    fig.update_layout(title='Funding Amount Distribution (> $1K)', xaxis_title='amount', yaxis_title='count',
+                      bargap=0, plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font_color='#FAFAFA', title_x=0.5)
+    return fig
+
 def display_amount_distribution_chart(df: pd.DataFrame):
     """Display amount distribution chart"""
     if df.empty or 'amount' not in df.columns: 
         st.caption("No data for 'Amount Distribution'.")
         return
     
-    df_filtered = df[df['amount'] > 1000] 
-    if df_filtered.empty: 
+    fig = _build_distribution_figure(df[['amount']])
+    if fig is None: 
         st.caption("No significant funding amounts for distribution.")
         return
-    
-    fig = px.histogram(df_filtered, x='amount', nbins=30, title='Funding Amount Distribution (> $1K)', 
-                      color_discrete_sequence=['#636EFA'])
-    fig.update_layout(plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font_color='#FAFAFA', title_x=0.5)
     st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_timeline_figure(df: pd.DataFrame):
+    """Build the monthly funding line chart, or None if no date parses"""
+    import plotly.graph_objects as go
+    # Dates are stored as ISO strings by the scraper; skip per-value format inference
+    df = df.assign(date=pd.to_datetime(df['date'], errors='coerce', format='ISO8601', cache=True))
+    df = df.dropna(subset=['date'])
+    if df.empty:
+        return None
+
+    df = df.assign(month_year=df['date'].dt.to_period('M').astype(str))
+    df_agg = df.groupby('month_year', as_index=False).agg(Total_Amount=('amount', 'sum')).sort_values('month_year')
+    
+    # Plain numpy arrays let Plotly serialize the trace without per-element Series handling
+    fig = go.Figure(go.Scatter(x=df_agg['month_year'].to_numpy(), y=df_agg['Total_Amount'].to_numpy(),
+                               mode='lines+markers', line_color='#00CC96'))
+    fig.update_layout(title='Funding Timeline (Monthly)', yaxis_title='Total_Amount',
+                      plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font_color='#FAFAFA', title_x=0.5, xaxis_title='Month')
+    return fig
+
 def display_funding_timeline_chart(df: pd.DataFrame):
     """Display funding timeline chart"""
     if df.empty or 'date' not in df.columns or 'amount' not in df.columns:
         st.caption("Insufficient data for 'Funding Timeline'.")
         return
     
-    df['date'] = pd.to_datetime(df['date'], errors='coerce')
-    df = df.dropna(subset=['date'])
-    
-    if df.empty: 
+    fig = _build_timeline_figure(df[['date', 'amount']])
+    if fig is None: 
         st.caption("No valid dates for timeline.")
         return
-    
-    df['month_year'] = df['date'].dt.to_period('M').astype(str)
-    df_agg = df.groupby('month_year', as_index=False).agg(Total_Amount=('amount', 'sum')).sort_values('month_year')
-    
-    if df_agg.empty: 
-        st.caption("No data for timeline after processing.")
-        return
-    
-    fig = px.line(df_agg, x='month_year', y='Total_Amount', title='Funding Timeline (Monthly)', 
-                  markers=True, color_discrete_sequence=['#00CC96'])
-    fig.update_layout(plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font_color='#FAFAFA', title_x=0.5, xaxis_title='Month')
     st.plotly_chart(fig, use_container_width=True)
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_type_figure(df: pd.DataFrame):
+    """Build the companies-by-type pie chart, or None if there are no counts"""
+    import plotly.express as px
+    # Distinct companies per type: one value_counts pass over the de-duplicated pairs
+    type_counts = df.drop_duplicates(['company_type', 'company_name'])['company_type'].value_counts()
+    type_counts = type_counts[type_counts > 0]
+    if type_counts.empty:
+        return None
+    
+    fig = px.pie(values=type_counts.to_numpy(), names=type_counts.index, title='Companies by Type', 
+                 color_discrete_sequence=px.colors.qualitative.Set3)
+    fig.update_layout(plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font_color='#FAFAFA', title_x=0.5, legend_title_text='Company Type')
+    return fig
+
 def display_funding_by_type_chart(df: pd.DataFrame):
     """Display funding by type chart"""
     if df.empty or 'company_type' not in df.columns:
         st.caption("No data for 'Funding by Type'.")
         return
     
-    df_agg = df.groupby('company_type', as_index=False).agg(Company_Count=('company_name', 'nunique')) 
-    df_agg = df_agg[df_agg['Company_Count'] > 0].sort_values('Company_Count', ascending=False)
-    
-    if df_agg.empty: 
+    fig = _build_type_figure(df[['company_type', 'company_name']])
+    if fig is None: 
         st.caption("No company counts by type available.")
         return
-    
-    fig = px.pie(df_agg, values='Company_Count', names='company_type', title='Companies by Type', 
-                 color_discrete_sequence=px.colors.qualitative.Set3)
-    fig.update_layout(plot_bgcolor='#0E1117', paper_bgcolor='#0E1117', font_color='#FAFAFA', title_x=0.5, legend_title_text='Company Type')
     st.plotly_chart(fig, use_container_width=True)
 
-def display_pagination_info(current_page: int, total_pages: int, items_per_page: int, total_items: int):
-    """Display pagination information"""
+_CHART_VIEWS = {
+    "💰 By Round": display_funding_by_round_chart,
+    "📊 Distribution": display_amount_distribution_chart,
+    "📅 Timeline": display_funding_timeline_chart,
+    "🏢 By Type": display_funding_by_type_chart,
+}
+
+@st.fragment
+def _chart_panel(df: pd.DataFrame):
+    """Display the selected chart; switching charts reruns only this fragment"""
+    # Unlike st.tabs, only the visible chart's figure is built on each run
+    choice = st.radio("Chart", list(_CHART_VIEWS), horizontal=True, key="active_chart_tab", label_visibility="collapsed")
+    _CHART_VIEWS[choice](df)
+
+_PAGINATION_TEMPLATE = Template("<p style='text-align: center; color: #9CA3AF; font-size:0.9rem;'>Showing $start-$end of $total results</p>")
+
+@lru_cache(maxsize=256)
+def _pagination_html(current_page: int, items_per_page: int, total_items: int) -> str:
+    """Build the pagination summary line for a page position"""
     start_item = (current_page - 1) * items_per_page + 1
     end_item = min(current_page * items_per_page, total_items)
-    st.markdown(f"<p style='text-align: center; color: #9CA3AF; font-size:0.9rem;'>Showing {start_item}-{end_item} of {total_items:,} results</p>", unsafe_allow_html=True)
\ No newline at end of file
+    return _PAGINATION_TEMPLATE.substitute(start=start_item, end=end_item, total=f"{total_items:,}")
+
+def display_pagination_info(current_page: int, total_pages: int, items_per_page: int, total_items: int):
+    """Display pagination information"""
+    st.html(_pagination_html(current_page, items_per_page, total_items))
\ No newline at end of file
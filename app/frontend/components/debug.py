@@ -1,9 +1,66 @@
 import streamlit as st
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Tuple
+from functools import lru_cache
+from urllib.parse import urljoin
 from app.frontend.utils.api_client import api_client
 from app.shared.config import Config
 
+# (connect, read) timeouts for the diagnostic probes
+_DEBUG_TIMEOUT = (3, 10)
+
+@st.cache_resource
+def _debug_session() -> requests.Session:
+    """Keep-alive session shared by the debug probes across reruns"""
+    session = requests.Session()
+    # No retries: a diagnostic probe should report the first failure, not mask it
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Larger payloads are shown as truncated text rather than an interactive tree
+_MAX_JSON_CHARS = 50_000
+
+def _show_json(payload: Any):
+    """Display a JSON payload, serialized once and truncated if very large"""
+    text = json.dumps(payload, indent=2, default=str)
+    if len(text) > _MAX_JSON_CHARS:
+        st.code(text[:_MAX_JSON_CHARS] + "\n…", language="json")
+        st.caption(f"Showing the first {_MAX_JSON_CHARS:,} of {len(text):,} characters")
+    else:
+        st.json(text)
+
+# Probe responses beyond this are previewed as text instead of being downloaded and parsed
+_MAX_RESPONSE_BYTES = 1_000_000
+
+def _read_capped(response: requests.Response) -> Tuple[bytes, bool]:
+    """Read a streamed response body up to the cap; also report whether it was cut short"""
+    chunks, size = [], 0
+    for chunk in response.iter_content(chunk_size=65536):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > _MAX_RESPONSE_BYTES:
+            response.close()
+            return b"".join(chunks)[:_MAX_RESPONSE_BYTES], True
+    return b"".join(chunks), False
+
+def _show_response(response: requests.Response):
+    """Display a probe response as JSON, falling back to text when it is too large or not JSON"""
+    body, truncated = _read_capped(response)
+    if truncated:
+        st.warning(f"Response exceeds {_MAX_RESPONSE_BYTES:,} bytes; showing a text preview")
+        st.code(body[:_MAX_JSON_CHARS].decode(errors="replace"), language="json")
+        return
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        st.text(body.decode(errors="replace"))
+    else:
+        _show_json(payload)
+
 def display_debug_panel():
     """Display debug panel for troubleshooting connectivity issues"""
     
@@ -34,16 +91,21 @@ def display_debug_panel():
         if st.button("🧪 Test API Connection", type="primary"):
             with st.spinner("Testing API connection..."):
                 
+                # The direct probe and the client diagnostics are independent; overlap their round-trips
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    direct_future = executor.submit(_debug_session().get, f"{Config.API_BASE_URL}/api/health",
+                                                    timeout=_DEBUG_TIMEOUT, stream=True)
+                    diagnostics_future = executor.submit(api_client.test_connection)
+                
                 # Test direct URL access
                 st.markdown("**Direct URL Test:**")
                 try:
-                    response = requests.get(f"{Config.API_BASE_URL}/api/health", timeout=10)
+                    response = direct_future.result()
                     if response.status_code == 200:
                         st.success(f"✅ Direct connection successful (Status: {response.status_code})")
                         
                         # Show health data
-                        health_data = response.json()
-                        st.json(health_data)
+                        _show_response(response)
                     else:
                         st.error(f"❌ Direct connection failed (Status: {response.status_code})")
                         st.text(response.text)
@@ -60,7 +122,8 @@ def display_debug_panel():
                 # Test API Client
                 st.markdown("**API Client Test:**")
                 try:
-                    diagnostics = api_client.test_connection()
+                    diagnostics = diagnostics_future.result()
+                    st.session_state['_debug_diagnostics'] = diagnostics
                     
                     if diagnostics["health_check"]:
                         st.success("✅ API Client connection successful")
@@ -70,14 +133,14 @@ def display_debug_panel():
                     
                     if diagnostics["connection_error"]:
                         st.error(f"Error: {diagnostics['connection_error']}")
-                    
-                    # Show full diagnostics
-                    with st.expander("Full Diagnostics"):
-                        st.json(diagnostics)
                         
                 except Exception as e:
                     st.error(f"❌ API Client test failed: {str(e)}")
         
+        # Kept from the last test and only serialized once the user asks to see it
+        if '_debug_diagnostics' in st.session_state and st.checkbox("Show full diagnostics", key="_show_diag"):
+            _show_json(st.session_state['_debug_diagnostics'])
+        
         st.markdown("---")
         
         # Quick data test
@@ -85,24 +148,29 @@ def display_debug_panel():
         
         if st.button("🧪 Test Data Endpoints"):
             
+            # Both requests are I/O bound; run them together so the wait is the slower one, not the sum
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                data_future = executor.submit(api_client.get_funding_data, page=1, items_per_page=1)
+                rounds_future = executor.submit(api_client.get_funding_rounds)
+            
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("**Funding Data:**")
                 try:
-                    data = api_client.get_funding_data(page=1, items_per_page=1)
+                    data = data_future.result()
                     st.success(f"✅ Retrieved {data.get('totalCount', 0)} total records")
                     if data.get('data'):
-                        st.json(data['data'][0])
+                        _show_json(data['data'][0])
                 except Exception as e:
                     st.error(f"❌ Failed: {str(e)}")
             
             with col2:
                 st.markdown("**Funding Rounds:**")
                 try:
-                    rounds = api_client.get_funding_rounds()
+                    rounds = rounds_future.result()
                     st.success(f"✅ Retrieved {len(rounds)} funding rounds")
-                    st.json(rounds[:5])  # Show first 5
+                    _show_json(rounds[:5])  # Show first 5
                 except Exception as e:
                     st.error(f"❌ Failed: {str(e)}")
         
@@ -120,19 +188,15 @@ def display_debug_panel():
         if st.button("🔍 Test Endpoint"):
             if endpoint:
                 try:
-                    url = f"{Config.API_BASE_URL}{endpoint}"
+                    url = urljoin(Config.API_BASE_URL.rstrip('/') + '/', endpoint.lstrip('/'))
                     st.info(f"Testing: {url}")
                     
-                    response = requests.get(url, timeout=10)
+                    response = _debug_session().get(url, timeout=_DEBUG_TIMEOUT, stream=True)
                     
                     st.success(f"Status: {response.status_code}")
                     
-                    # Try to parse as JSON
-                    try:
-                        json_data = response.json()
-                        st.json(json_data)
-                    except:
-                        st.text(response.text)
+                    # Shown as JSON when it parses, otherwise as text
+                    _show_response(response)
                         
                 except Exception as e:
                     st.error(f"Error: {str(e)}")
@@ -210,23 +274,28 @@ def display_troubleshooting_guide():
         ```
         """)
 
-def display_environment_info():
-    """Display environment information"""
-    
-    st.markdown("### 🌍 Environment Information")
-    
+@lru_cache(maxsize=1)
+def _env_info() -> Dict[str, str]:
+    """Process-level environment details; platform.platform() probes the OS, so run it once"""
     import os
     import sys
     import platform
     
-    env_info = {
+    return {
         "Python Version": sys.version,
         "Platform": platform.platform(),
         "Docker Environment": os.getenv("DOCKER_ENV", "false"),
         "Current Working Directory": os.getcwd(),
     }
+
+def display_environment_info():
+    """Display environment information"""
+    
+    st.markdown("### 🌍 Environment Information")
+    
+    import os
     
-    for key, value in env_info.items():
+    for key, value in _env_info().items():
         st.text(f"{key}: {value}")
     
     # Environment variables (masked for security)
@@ -1,11 +1,45 @@
 import streamlit as st
+import threading
+import time
+from typing import Dict, Any
 from app.frontend.utils.api_client import api_client
 
-def display_api_status():
+# Seconds between background health probes
+_HEALTH_POLL_INTERVAL = 5
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _cached_health() -> bool:
+    """Health check shared by every status display within a short window"""
+    return api_client.health_check()
+
+@st.cache_resource
+def _health_poller() -> Dict[str, Any]:
+    """Start one daemon thread per process that keeps the latest health result"""
+    state = {'healthy': None, 'checked_at': 0.0}
+
+    def poll():
+        while True:
+            try:
+                state['healthy'] = api_client.health_check()
+            except Exception:
+                state['healthy'] = False
+            state['checked_at'] = time.time()
+            time.sleep(_HEALTH_POLL_INTERVAL)
+
+    threading.Thread(target=poll, name="api-health-poller", daemon=True).start()
+    return state
+
+def display_api_status(use_cache: bool = True):
     """Display minimal API status for debugging"""
     try:
-        is_healthy = api_client.health_check()
+        if use_cache:
+            # Read the poller's last result; only the very first render waits on a request
+            is_healthy = _health_poller()['healthy']
+            if is_healthy is None:
+                is_healthy = _cached_health()
+        else:
+            is_healthy = api_client.health_check()
         if not is_healthy:
             st.warning("⚠️ API connection issue detected")
     except Exception:
-        st.error("❌ Cannot connect to backend API")
\ No newline at end of file
+        st.error("❌ Cannot connect to backend API")
@@ -1,3 +0,0 @@
-# This file is preserved for future use if needed
-# All search functionality is now integrated into the main app
-pass
\ No newline at end of file
@@ -1,14 +1,15 @@
 import streamlit as st
-import time
 import logging
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-from app.frontend.components.data_display import display_funding_cards
-from app.frontend.utils.api_client import api_client
-from app.shared.config import Config
+# The API client (requests, config) and data_display (pandas, bs4) are imported where first used,
+# so the page config, CSS and header reach the browser before those modules load
 
 # Page configuration with cybersecurity-themed icon
 st.set_page_config(
@@ -18,9 +19,7 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-def load_professional_css():
-    """Load optimized professional dark theme CSS"""
-    st.markdown("""
+_PROFESSIONAL_CSS = """
     <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
     
@@ -182,42 +181,33 @@ def load_professional_css():
         margin-bottom: 1rem;
     }
     
-    .center-button {
-        text-align: center;
-        padding: 0.5rem;
-        background: #8b5cf6;
-        color: white;
-        border-radius: 4px;
-        font-weight: 600;
-    }
-    
-    a[style*="cursor: pointer;"]:hover {
-        filter: brightness(1.2);
-    }
-    
-    div[data-testid="stVerticalBlock"] div[data-testid="stVerticalBlock"] div[data-testid="stMarkdownContainer"] h3 {
-        margin-bottom: 0.25rem !important; 
+    div[role="radiogroup"] {
+        justify-content: center;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def load_professional_css():
+    """Load optimized professional dark theme CSS"""
+    # Kept on st.markdown: a style-only st.html element still reserves a row in the layout
+    st.markdown(_PROFESSIONAL_CSS, unsafe_allow_html=True)
+
+@dataclass
+class UIState:
+    current_page: int = 1
+    search_term: str = ''
+    filter_round: str = ''
+    sort_field: str = 'date'
+    sort_direction: str = 'desc'
+    items_per_page: int = 12
+    available_rounds: List[str] = field(default_factory=list)
 
 def initialize_session_state():
     """Initialize session state variables"""
-    defaults = {
-        'current_page': 1,
-        'search_term': '',
-        'filter_round': '',
-        'sort_field': 'date',
-        'sort_direction': 'desc',
-        'available_rounds': []
-    }
-    for key, value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+    # Kept under one key so the per-rerun check is a single lookup
+    st.session_state.setdefault('ui', UIState())
 
-def display_header_section():
-    """Display the header section with enhanced logo"""
-    st.markdown("""
+_HEADER_HTML = """
     <div class="header-section">
         <div class="logo-wrapper">
             <span class="logo-icon">🛡️💰</span>
@@ -232,21 +222,83 @@ def display_header_section():
             Track the pulse of cyber innovation with comprehensive data insights.
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def display_header_section():
+    """Display the header section with enhanced logo"""
+    st.html(_HEADER_HTML)
+
+@st.cache_resource
+def _api_client():
+    """The shared API client, held across reruns so its connection pool and response cache are reused"""
+    from app.frontend.utils.api_client import api_client
+    return api_client
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_stats() -> Dict[str, Any]:
+    """Database statistics, refreshed at most every 30s or after a collection"""
+    return _api_client().get_stats()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _load_funding_rounds() -> List[str]:
+    """Available funding rounds; these change only when new data is collected"""
+    return _api_client().get_funding_rounds()
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _load_funding_data(page: int, items_per_page: int, sort_field: str, sort_direction: str,
+                       search: Optional[str], filter_round: Optional[str]) -> Dict[str, Any]:
+    """One page of funding data, shared across sessions for a minute"""
+    return _api_client().get_funding_data(
+        page=page,
+        items_per_page=items_per_page,
+        sort_field=sort_field,
+        sort_direction=sort_direction,
+        search=search,
+        filter_round=filter_round
+    )
+
+@st.cache_data(ttl=30, max_entries=256, show_spinner=False)
+def _load_bootstrap(page: int, items_per_page: int, sort_field: str, sort_direction: str,
+                    search: Optional[str], filter_round: Optional[str]) -> Dict[str, Any]:
+    """Stats, rounds and one page of funding data in a single round-trip"""
+    return _api_client().get_bootstrap(
+        page=page,
+        items_per_page=items_per_page,
+        sort_field=sort_field,
+        sort_direction=sort_direction,
+        search=search,
+        filter_round=filter_round
+    )
 
-def display_stats_section():
-    """Display statistics section with optimized API call"""
+@st.cache_data(ttl=300, show_spinner=False)
+def _round_options(rounds: tuple) -> List[str]:
+    """Round filter choices, sorted once per distinct round list"""
+    return ["All Rounds"] + sorted(rounds)
+
+@st.cache_resource
+def _request_executor() -> ThreadPoolExecutor:
+    """Worker threads for the page-load API calls, shared by every session in the process"""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="page-load")
+
+_STAT_BOX_TMPL = '<div class="stat-box"><div class="stat-value">{value}</div><div class="stat-label">{label}</div></div>'
+
+@lru_cache(maxsize=32)
+def _stats_html(total_companies: Any, funding_display: str, data_feed: str) -> str:
+    """Stat boxes markup; rebuilt only when the displayed figures change"""
+    stat_boxes = "".join(_STAT_BOX_TMPL.format(value=value, label=label) for value, label in (
+        (funding_display, "Total Funding"),
+        (f"{total_companies}+", "Companies"),
+        (data_feed, "Data Feed"),
+    ))
+    return f'<div class="stats-container">{stat_boxes}</div>'
+
+def display_stats_section(load_stats: Callable[[], Dict[str, Any]]):
+    """Display statistics section; load_stats returns the already requested stats"""
+    from app.frontend.utils.formatters import format_funding_total
     try:
-        stats = api_client.get_stats()
+        stats = load_stats()
         total_companies = stats.get('total_companies', 0)
-        total_funding = stats.get('total_funding', 0)
-        
-        if total_funding >= 1000000000:
-            funding_display = f"${total_funding / 1000000000:.1f}B+"
-        elif total_funding >= 1000000:
-            funding_display = f"${total_funding / 1000000:.0f}M+"
-        else:
-            funding_display = f"${total_funding:,.0f}+"
+        funding_display = format_funding_total(stats.get('total_funding', 0))
         
         data_feed = "Live"
         
@@ -256,202 +308,275 @@ def display_stats_section():
         funding_display = "---"
         data_feed = "---"
     
-    st.markdown(f"""
-    <div class="stats-container">
-        <div class="stat-box">
-            <div class="stat-value">{funding_display}</div>
-            <div class="stat-label">Total Funding</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{total_companies}+</div>
-            <div class="stat-label">Companies</div>
-        </div>
-        <div class="stat-box">
-            <div class="stat-value">{data_feed}</div>
-            <div class="stat-label">Data Feed</div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_stats_html(total_companies, funding_display, data_feed))
 
-def display_collect_button():
-    """Display the collect intelligence button"""
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        if st.button("🔍 Collect Latest Intelligence", use_container_width=True, key="collect_btn"):
-            with st.spinner("Collecting fresh intelligence..."):
-                try:
-                    result = api_client.trigger_data_collection()
-                    st.success("✅ Intelligence collected successfully!")
-                    time.sleep(1)
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Failed to collect data: {str(e)}")
+# Seconds between checks on a background data collection
+_COLLECT_POLL_SECONDS = 2
+
+@st.cache_resource
+def _collection_executor() -> ThreadPoolExecutor:
+    """Worker threads for data collections, shared by every session in the process"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="data-collection")
+
+@st.fragment(run_every=_COLLECT_POLL_SECONDS)
+def _collection_status():
+    """Poll the pending collection and rerun the whole app once it has finished"""
+    future = st.session_state.get('collect_future')
+    if future is None:
+        return
+    if not future.done():
+        st.info("⏳ Collecting fresh intelligence in the background...")
+        return
+    
+    del st.session_state['collect_future']
+    try:
+        future.result()
+    except Exception as e:
+        st.session_state.collect_error = str(e)
+    else:
+        # Responses cached while the collection was running are already stale
+        _api_client().clear_cache()
+        _load_stats.clear()
+        _load_funding_rounds.clear()
+        _load_funding_data.clear()
+        _load_bootstrap.clear()
+        st.session_state.ui.available_rounds = []
+        st.session_state.collect_succeeded = True
+    st.rerun()
 
-    st.markdown("""
+_COLLECT_CAPTION_HTML = """
     <div style="text-align: center; margin-bottom: 2rem;">
         <p style="color: #6b7280; font-size: 0.75rem;">
             Triggers fresh data collection from security funding sources
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+def display_collect_button():
+    """Display the collect intelligence button"""
+    # Outcome of a finished background collection is reported on the run after it completes
+    if st.session_state.pop('collect_succeeded', False):
+        st.toast("✅ Intelligence collected successfully!")
+    collect_error = st.session_state.pop('collect_error', None)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        pending = 'collect_future' in st.session_state
+        if st.button("🔍 Collect Latest Intelligence", use_container_width=True, key="collect_btn", disabled=pending):
+            # Collection can take minutes; run it off the script thread so the page stays usable
+            st.session_state.collect_future = _collection_executor().submit(_api_client().trigger_data_collection)
+            pending = True
+        if pending:
+            _collection_status()
+        if collect_error:
+            st.error(f"Failed to collect data: {collect_error}")
+
+    st.html(_COLLECT_CAPTION_HTML)
+
+# Sort selector label -> API sort field
+_SORT_FIELDS = {
+    "Sort by Date": "date",
+    "Sort by Company": "company_name",
+    "Sort by Amount": "amount"
+}
+_SORT_LABELS = tuple(_SORT_FIELDS)
 
 def display_controls():
     """Display optimized search and filter controls"""
-    col1, col2, col3 = st.columns([3, 1, 1])
-    
-    with col1:
-        search_term = st.text_input(
-            "",
-            placeholder="🔍 Search companies, descriptions, technologies...",
-            value=st.session_state.search_term,
-            label_visibility="collapsed",
-            key="search_input"
-        )
+    ui = st.session_state.ui
     
-    with col2:
-        if not st.session_state.available_rounds:
-            try:
-                rounds = api_client.get_funding_rounds()
-                st.session_state.available_rounds = rounds
-            except Exception as e:
-                logger.warning(f"Failed to fetch rounds: {e}")
-                st.session_state.available_rounds = []
+    # A form commits search, round and sort together on Apply/Enter: one results fetch per change, not per widget
+    with st.form("filters", border=False):
+        col1, col2, col3, col4 = st.columns([3, 1, 1, 0.6])
+        
+        with col1:
+            search_term = st.text_input(
+                "",
+                placeholder="🔍 Search companies, descriptions, technologies...",
+                value=ui.search_term,
+                label_visibility="collapsed",
+                key="search_input"
+            )
+        
+        with col2:
+            if not ui.available_rounds:
+                try:
+                    rounds = _load_funding_rounds()
+                    ui.available_rounds = rounds
+                except Exception as e:
+                    logger.warning(f"Failed to fetch rounds: {e}")
+                    ui.available_rounds = []
         
-        options = ["All Rounds"] + sorted(st.session_state.available_rounds)
-        current_display = st.session_state.filter_round if st.session_state.filter_round else "All Rounds"
+            options = _round_options(tuple(ui.available_rounds))
+            current_display = ui.filter_round if ui.filter_round else "All Rounds"
         
-        filter_round = st.selectbox(
-            "",
-            options,
-            index=options.index(current_display) if current_display in options else 0,
-            label_visibility="collapsed",
-            key="round_filter"
-        )
-    
-    with col3:
-        sort_options = {
-            "Sort by Date": "date",
-            "Sort by Company": "company_name", 
-            "Sort by Amount": "amount"
-        }
-        sort_by = st.selectbox(
-            "",
-            list(sort_options.keys()),
-            index=0,
-            label_visibility="collapsed",
-            key="sort_select"
-        )
+            filter_round = st.selectbox(
+                "",
+                options,
+                index=options.index(current_display) if current_display in options else 0,
+                label_visibility="collapsed",
+                key="round_filter"
+            )
+        
+        with col3:
+            sort_by = st.selectbox(
+                "",
+                _SORT_LABELS,
+                index=0,
+                label_visibility="collapsed",
+                key="sort_select"
+            )
+        
+        with col4:
+            submitted = st.form_submit_button("Apply", use_container_width=True)
 
     new_filter_round = "" if filter_round == "All Rounds" else filter_round
-    new_sort_field = sort_options[sort_by]
-    
-    if (search_term != st.session_state.search_term or
-        new_filter_round != st.session_state.filter_round or
-        new_sort_field != st.session_state.sort_field):
-        st.session_state.search_term = search_term
-        st.session_state.filter_round = new_filter_round
-        st.session_state.sort_field = new_sort_field
-        st.session_state.current_page = 1
-        st.rerun()
-
-def display_pagination(current_page: int, total_pages: int, total_count: int, location: str = "top"):
+    new_sort_field = _SORT_FIELDS[sort_by]
+    
+    if submitted and (search_term != ui.search_term or
+                      new_filter_round != ui.filter_round or
+                      new_sort_field != ui.sort_field):
+        ui.search_term = search_term
+        ui.filter_round = new_filter_round
+        ui.sort_field = new_sort_field
+        # The results below are fetched after this, so no rerun is needed to pick up the change
+        ui.current_page = 1
+
+_PAGER_FIRST, _PAGER_PREV, _PAGER_NEXT, _PAGER_LAST = "⏮", "◀", "▶", "⏭"
+
+def _on_page_select(key: str, targets: Dict[str, int]):
+    """Pager callback; it runs before the rerun, so the chosen page renders straight away"""
+    st.session_state.ui.current_page = targets[st.session_state[key]]
+
+def display_pagination(current_page: int, total_pages: int, total_count: int, items_per_page: int):
     """Display optimized pagination controls"""
     if total_pages <= 1:
         return
     
-    if location == "top":
-        items_per_page = 12
-        start = (current_page - 1) * items_per_page + 1
-        end = min(current_page * items_per_page, total_count)
-        
-        st.markdown(f"""
-        <div class="results-info">
-            Showing {start} to {end} of {total_count} results
-        </div>
-        """, unsafe_allow_html=True)
-    
-    cols = st.columns([1, 1, 1, 1, 1, 1, 1])
-    
-    with cols[0]:
-        if st.button("◀◀", disabled=(current_page <= 1), key=f"first_{location}"):
-            st.session_state.current_page = 1
-            st.rerun()
+    start = (current_page - 1) * items_per_page + 1
+    end = min(current_page * items_per_page, total_count)
     
-    with cols[1]:
-        if st.button("◀", disabled=(current_page <= 1), key=f"prev_{location}"):
-            st.session_state.current_page = current_page - 1
-            st.rerun()
-    
-    with cols[2]:
-        if current_page > 1:
-            if st.button(str(current_page - 1), key=f"page_prev_{location}"):
-                st.session_state.current_page = current_page - 1
-                st.rerun()
-        else:
-            st.write("")
+    st.html(f"""
+    <div class="results-info">
+        Showing {start} to {end} of {total_count} results
+    </div>
+    """)
+    
+    # One radio replaces the row of buttons; each label maps to the page it leads to
+    targets = {}
+    if current_page > 1:
+        targets.update({_PAGER_FIRST: 1, _PAGER_PREV: current_page - 1, str(current_page - 1): current_page - 1})
+    targets[str(current_page)] = current_page
+    if current_page < total_pages:
+        targets.update({str(current_page + 1): current_page + 1, _PAGER_NEXT: current_page + 1, _PAGER_LAST: total_pages})
+    labels = list(targets)
+    # Keyed per page so the new page starts with its own label selected rather than the arrow just clicked
+    key = f"pager_{current_page}"
+    
+    st.radio(
+        "Page",
+        labels,
+        index=labels.index(str(current_page)),
+        horizontal=True,
+        label_visibility="collapsed",
+        key=key,
+        on_change=_on_page_select,
+        args=(key, targets)
+    )
+
+def _page_query() -> Dict[str, Any]:
+    """Funding-data request for the page described by the session state"""
+    ui = st.session_state.ui
+    return {
+        'page': ui.current_page,
+        'items_per_page': ui.items_per_page,
+        'sort_field': ui.sort_field,
+        'sort_direction': ui.sort_direction,
+        'search': ui.search_term or None,
+        'filter_round': ui.filter_round or None,
+    }
+
+# How long a page fetch may take before skeleton cards are drawn in its place
+_SKELETON_DELAY_SECONDS = 0.15
+
+@st.fragment
+def display_results_section():
+    """Display the controls, cards and pagination; interacting with them reruns only this section"""
+    display_controls()
     
-    with cols[3]:
-        st.markdown(f"""
-        <div class="center-button">
-            {current_page}
-        </div>
-        """, unsafe_allow_html=True)
+    from app.frontend.components.data_display import display_funding_cards, display_loading_cards
+    # Holds skeleton cards while a slow page fetch runs, then the results replace them in place
+    results = st.empty()
     
-    with cols[4]:
-        if current_page < total_pages:
-            if st.button(str(current_page + 1), key=f"page_next_{location}"):
-                st.session_state.current_page = current_page + 1
-                st.rerun()
+    try:
+        # The full run hands over the page it already fetched; later reruns of this section fetch their own
+        query = _page_query()
+        prefetched = st.session_state.pop('prefetched_page', None)
+        if prefetched and prefetched[0] == query:
+            data = prefetched[1]
         else:
-            st.write("")
-    
-    with cols[5]:
-        if st.button("▶", disabled=(current_page >= total_pages), key=f"next_{location}"):
-            st.session_state.current_page = current_page + 1
-            st.rerun()
-    
-    with cols[6]:
-        if st.button("▶▶", disabled=(current_page >= total_pages), key=f"last_{location}"):
-            st.session_state.current_page = total_pages
-            st.rerun()
+            # Cached pages come back almost at once; only a fetch that is still running gets the skeleton
+            future = _request_executor().submit(_load_funding_data, **query)
+            try:
+                data = future.result(timeout=_SKELETON_DELAY_SECONDS)
+            except FutureTimeoutError:
+                with results:
+                    display_loading_cards()
+                data = future.result()
+        
+        with results.container():
+            if data and data.get('data'):
+                companies = data['data']
+                total_count = data.get('totalCount', 0)
+                total_pages = data.get('totalPages', 1)
+                current_page = data.get('currentPage', 1)
+                # The backend may cap the page size, so count with the one it used
+                items_per_page = data.get('itemsPerPage', query['items_per_page'])
+                
+                if total_pages > 1:
+                    display_pagination(current_page, total_pages, total_count, items_per_page)
+                display_funding_cards(companies)
+            else:
+                st.info("No funding data available. Click 'Collect Latest Intelligence' to fetch data.")
+            
+    except Exception as e:
+        results.error(f"Failed to load data: {str(e)}")
+        logger.error(f"Error loading data: {str(e)}")
 
 def main():
     """Main application"""
     load_professional_css()
     initialize_session_state()
+    ui = st.session_state.ui
+    
+    # Stats, rounds and the current page come back in one round-trip; the header renders while it is in flight
+    executor = _request_executor()
+    query = _page_query()
+    bundle_future = executor.submit(_load_bootstrap, **query)
     
     display_header_section()
-    display_stats_section()
-    display_collect_button()
-    display_controls()
     
     try:
-        data = api_client.get_funding_data(
-            page=st.session_state.current_page,
-            items_per_page=12,
-            sort_field=st.session_state.sort_field,
-            sort_direction=st.session_state.sort_direction,
-            search=st.session_state.search_term or None,
-            filter_round=st.session_state.filter_round or None
-        )
-        
-        if data and data.get('data'):
-            companies = data['data']
-            total_count = data.get('totalCount', 0)
-            total_pages = data.get('totalPages', 1)
-            current_page = data.get('currentPage', 1)
-            
-            display_pagination(current_page, total_pages, total_count, location="top")
-            display_funding_cards(companies)
-            
-            if total_pages > 1:
-                display_pagination(current_page, total_pages, total_count, location="bottom")
-        else:
-            st.info("No funding data available. Click 'Collect Latest Intelligence' to fetch data.")
-            
+        bundle = bundle_future.result()
     except Exception as e:
-        st.error(f"Failed to load data: {str(e)}")
-        logger.error(f"Error loading data: {str(e)}")
+        logger.warning(f"Bootstrap request failed, loading sections separately: {e}")
+        bundle = {}
+    
+    # Sections missing from the bundle are requested on their own, concurrently.
+    # The results section reads rounds and data through the same caches, waiting on these if still in flight.
+    load_stats = (lambda: bundle['stats']) if 'stats' in bundle else executor.submit(_load_stats).result
+    if bundle.get('rounds') is not None:
+        ui.available_rounds = bundle['rounds']
+    elif not ui.available_rounds:
+        executor.submit(_load_funding_rounds)
+    if 'funding' in bundle:
+        st.session_state.prefetched_page = (query, bundle['funding'])
+    else:
+        executor.submit(_load_funding_data, **query)
+    
+    display_stats_section(load_stats)
+    display_collect_button()
+    display_results_section()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
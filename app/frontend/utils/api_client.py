@@ -12,19 +12,23 @@ class APIClient:
     def __init__(self, base_url: str = None):
         self.base_url = base_url or Config.API_BASE_URL
         self.session = requests.Session()
-        self.session.timeout = 30
+        # requests ignores Session.timeout, so the (connect, read) pair is applied per request
+        self.timeout = (5, 30)
         
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Sized for concurrent Streamlit sessions sharing this client; idle connections are kept alive
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=16, pool_maxsize=40)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
         self._cache = {}
         self._cache_ttl = 300  # 5 minutes
+        # cache key -> (ETag, body) for endpoints revalidated with If-None-Match once the TTL lapses
+        self._etags = {}
         
         logger.info(f"API Client initialized with base URL: {self.base_url}")
     
@@ -37,27 +41,28 @@ class APIClient:
     
     def _is_cache_valid(self, key: str) -> bool:
         """Check if cached data is still valid"""
-        if key not in self._cache:
-            return False
-        cached_time, _ = self._cache[key]
-        return time.time() - cached_time < self._cache_ttl
+        # Single .get: another thread may evict the key between a membership test and the read
+        entry = self._cache.get(key)
+        return entry is not None and time.time() - entry[0] < self._cache_ttl
     
     def _get_cached_data(self, key: str) -> Any:
         """Get cached data if valid"""
-        if self._is_cache_valid(key):
-            return self._cache[key][1]
+        entry = self._cache.get(key)
+        if entry is not None and time.time() - entry[0] < self._cache_ttl:
+            return entry[1]
         return None
     
     def _cache_data(self, key: str, data: Any):
         """Cache data with timestamp"""
         self._cache[key] = (time.time(), data)
     
-    def _make_request(self, method: str, endpoint: str, use_cache: bool = True, **kwargs) -> Dict[str, Any]:
+    def _make_request(self, method: str, endpoint: str, use_cache: bool = True, revalidate: bool = False,
+                      **kwargs) -> Dict[str, Any]:
         """Make HTTP request to API with error handling and caching"""
         url = f"{self.base_url}{endpoint}"
+        cache_key = self._get_cache_key(endpoint, kwargs.get('params'))
         
         if method.upper() == 'GET' and use_cache:
-            cache_key = self._get_cache_key(endpoint, kwargs.get('params'))
             cached_data = self._get_cached_data(cache_key)
             if cached_data is not None:
                 logger.debug(f"Cache hit for {endpoint}")
@@ -65,17 +70,24 @@ class APIClient:
         
         logger.debug(f"Making {method} request to: {url}")
         
+        if revalidate and cache_key in self._etags:
+            kwargs['headers'] = {**kwargs.get('headers', {}), 'If-None-Match': self._etags[cache_key][0]}
+        
         try:
+            kwargs.setdefault('timeout', self.timeout)
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
             
-            if not response.content:
+            if revalidate and response.status_code == 304 and cache_key in self._etags:
+                data = self._etags[cache_key][1]
+            elif not response.content:
                 return {}
-                
-            data = response.json()
+            else:
+                data = response.json()
+                if revalidate and response.headers.get('ETag'):
+                    self._etags[cache_key] = (response.headers['ETag'], data)
             
             if method.upper() == 'GET' and use_cache:
-                cache_key = self._get_cache_key(endpoint, kwargs.get('params'))
                 self._cache_data(cache_key, data)
             
             return data
@@ -120,14 +132,9 @@ class APIClient:
             
         return diagnostics
     
-    def get_funding_data(self, 
-                        page: int = 1,
-                        items_per_page: int = 12,
-                        sort_field: str = 'date',
-                        sort_direction: str = 'desc',
-                        search: Optional[str] = None,
-                        filter_round: Optional[str] = None) -> Dict[str, Any]:
-        """Get paginated funding data"""
+    def _page_params(self, page: int, items_per_page: int, sort_field: str, sort_direction: str,
+                     search: Optional[str], filter_round: Optional[str]) -> Dict[str, Any]:
+        """Build the query parameters for a page of funding data"""
         params = {
             'page': page,
             'itemsPerPage': items_per_page,
@@ -140,24 +147,47 @@ class APIClient:
         if filter_round:
             params['filterRound'] = filter_round
         
+        return params
+    
+    def get_funding_data(self, 
+                        page: int = 1,
+                        items_per_page: int = 12,
+                        sort_field: str = 'date',
+                        sort_direction: str = 'desc',
+                        search: Optional[str] = None,
+                        filter_round: Optional[str] = None) -> Dict[str, Any]:
+        """Get paginated funding data"""
+        params = self._page_params(page, items_per_page, sort_field, sort_direction, search, filter_round)
         return self._make_request('GET', '/api/funding-data', params=params)
     
+    def get_bootstrap(self, 
+                      page: int = 1,
+                      items_per_page: int = 12,
+                      sort_field: str = 'date',
+                      sort_direction: str = 'desc',
+                      search: Optional[str] = None,
+                      filter_round: Optional[str] = None) -> Dict[str, Any]:
+        """Get stats, funding rounds and a page of funding data in one request"""
+        params = self._page_params(page, items_per_page, sort_field, sort_direction, search, filter_round)
+        return self._make_request('GET', '/api/bootstrap', params=params)
+    
     def get_funding_rounds(self) -> List[str]:
-        """Get available funding rounds"""
-        response = self._make_request('GET', '/api/funding-rounds')
+        """Get available funding rounds, revalidating the previous list by ETag"""
+        response = self._make_request('GET', '/api/funding-rounds', revalidate=True)
         return response.get('rounds', [])
     
     def trigger_data_collection(self) -> Dict[str, Any]:
         """Trigger fresh data collection"""
         logger.info("Triggering data collection...")
         
-        # Clear relevant caches
-        cache_keys_to_clear = [key for key in self._cache.keys() 
-                              if any(term in key for term in ['funding-data', 'stats'])]
+        # Clear relevant caches; page-load threads share this client, so iterate over a snapshot
+        cache_keys_to_clear = [key for key in list(self._cache)
+                              if any(term in key for term in ['funding-data', 'stats', 'bootstrap'])]
         for key in cache_keys_to_clear:
-            del self._cache[key]
+            self._cache.pop(key, None)
         
-        return self._make_request('GET', '/api/get_data', use_cache=False)
+        # Collection scrapes every source before responding; only the connect phase is bounded
+        return self._make_request('GET', '/api/get_data', use_cache=False, timeout=(self.timeout[0], None))
     
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
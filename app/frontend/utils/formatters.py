@@ -1,59 +1,114 @@
 import streamlit as st
+import pandas as pd
+import numpy as np
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import hashlib
+from functools import lru_cache
+
+# (divisor, suffix) pairs for amounts shown with one decimal place
+_AMOUNT_SCALES = ((1_000_000_000, 'B'), (1_000_000, 'M'))
 
 def format_amount(amount: Any) -> str:
-    """Format funding amount for display"""
+    """Format funding amount for display, rounding half-up to $X.YB, $X.YM or $XK"""
+    try:
+        return _format_amount(amount)
+    except TypeError:
+        # Unhashable input (e.g. a malformed API field) bypasses the cache
+        return _format_amount.__wrapped__(amount)
+
+@lru_cache(maxsize=4096)
+def _format_amount(amount: Any) -> str:
     try:
         num_amount = int(float(amount)) if amount is not None else 0
-        if num_amount >= 1000000000: 
-            return f"${num_amount / 1000000000:.1f}B"
-        if num_amount >= 1000000: 
-            return f"${num_amount / 1000000:.1f}M"
-        if num_amount >= 1000: 
-            return f"${num_amount / 1000:.0f}K"
-        if num_amount > 0: 
-            return f"${num_amount:,}"
-        return "Undisclosed"
-    except (ValueError, TypeError): 
+    except (ValueError, TypeError):
         return "Undisclosed"
 
+    # Integer arithmetic only: round to tenths (B/M) or whole thousands (K)
+    for divisor, suffix in _AMOUNT_SCALES:
+        if num_amount >= divisor:
+            tenths = (num_amount * 10 + divisor // 2) // divisor
+            return f"${tenths // 10}.{tenths % 10}{suffix}"
+    if num_amount >= 1000:
+        return f"${(num_amount + 500) // 1000}K"
+    if num_amount > 0:
+        return f"${num_amount:,}"
+    return "Undisclosed"
+
+def format_amount_series(amounts: pd.Series) -> pd.Series:
+    """Format a column of funding amounts; same rules as format_amount, one vector pass per scale"""
+    numeric = pd.to_numeric(amounts, errors='coerce').replace([np.inf, -np.inf], np.nan).fillna(0)
+    n = pd.Series(np.trunc(numeric.to_numpy(dtype=float)).astype(np.int64), index=amounts.index)
+    formatted = pd.Series("Undisclosed", index=amounts.index, dtype=object)
+
+    remaining = n > 0
+    for divisor, suffix in _AMOUNT_SCALES:
+        scaled = remaining & (n >= divisor)
+        tenths = (n[scaled] * 10 + divisor // 2) // divisor
+        formatted[scaled] = "$" + (tenths // 10).astype(str) + "." + (tenths % 10).astype(str) + suffix
+        remaining &= ~scaled
+    thousands = remaining & (n >= 1000)
+    formatted[thousands] = "$" + ((n[thousands] + 500) // 1000).astype(str) + "K"
+    remaining &= ~thousands
+    formatted[remaining] = "$" + n[remaining].astype(str)
+    return formatted
+
+def format_funding_total(total: Any) -> str:
+    """Format an aggregate funding figure for the headline stats as $X.YB+, $XM+ or $X,XXX+"""
+    amount = int(total or 0)
+    if amount >= 1_000_000_000:
+        tenths = (amount * 10 + 500_000_000) // 1_000_000_000
+        return f"${tenths // 10}.{tenths % 10}B+"
+    if amount >= 1_000_000:
+        return f"${(amount + 500_000) // 1_000_000}M+"
+    return f"${amount:,}+"
+
 def format_date(date_str: str) -> str:
     """Format date string for display"""
+    try:
+        return _format_date(date_str)
+    except TypeError:
+        return _format_date.__wrapped__(date_str)
+
+@lru_cache(maxsize=4096)
+def _format_date(date_str: str) -> str:
     try:
         date_obj = datetime.fromisoformat(date_str)
         return date_obj.strftime("%b %d, %Y")
     except:
         return date_str or "Unknown Date"
 
+# Predefined colors for common rounds
+_ROUND_COLORS = {
+    'pre-seed': '#f59e0b',
+    'seed': '#10b981',
+    'series a': '#3b82f6',
+    'series b': '#8b5cf6',
+    'series c': '#f97316',
+    'series d': '#ec4899',
+    'series e': '#14b8a6',
+    'growth': '#84cc16',
+    'late stage': '#ef4444',
+    'ipo': '#f59e0b',
+    'acquisition': '#06b6d4',
+    'venture': '#ff0990',
+    'equity crowdfunding': '#00fff2',
+    'unknown': '#6b7280'
+}
+
+# (color, fill, border) badge styles; fill/border are the color with an alpha suffix
+_ROUND_STYLES = {name: (color, f"{color}20", f"{color}40") for name, color in _ROUND_COLORS.items()}
+
+@lru_cache(maxsize=256)
 def get_round_color(round_name: str) -> str:
     """Get color for funding round badge with consistent mapping"""
     
-    # Predefined colors for common rounds
-    round_colors = {
-        'pre-seed': '#f59e0b',
-        'seed': '#10b981',
-        'series a': '#3b82f6',
-        'series b': '#8b5cf6',
-        'series c': '#f97316',
-        'series d': '#ec4899',
-        'series e': '#14b8a6',
-        'growth': '#84cc16',
-        'late stage': '#ef4444',
-        'ipo': '#f59e0b',
-        'acquisition': '#06b6d4',
-        'venture': '#ff0990',
-        'equity crowdfunding': '#00fff2',
-        'unknown': '#6b7280'
-    }
-    
     # Normalize the round name for lookup
     normalized_round = round_name.lower().strip()
     
     # Check for exact match first
-    if normalized_round in round_colors:
-        return round_colors[normalized_round]
+    if normalized_round in _ROUND_COLORS:
+        return _ROUND_COLORS[normalized_round]
     
     # Generate consistent color based on hash for unknown rounds
     hash_object = hashlib.md5(normalized_round.encode())
@@ -74,6 +129,15 @@ def get_round_color(round_name: str) -> str:
     
     return color
 
+@lru_cache(maxsize=256)
+def get_round_style(round_name: str) -> Tuple[str, str, str]:
+    """Get (color, fill, border) colors for a funding round badge"""
+    style = _ROUND_STYLES.get(round_name.lower().strip())
+    if style is None:
+        color = get_round_color(round_name)
+        style = (color, f"{color}20", f"{color}40")
+    return style
+
 def display_loading_animation():
     """Display professional loading animation"""
     st.markdown("""
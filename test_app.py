@@ -154,17 +154,24 @@ class CyberPulseTest:
         logger.info("🎨 Testing UI components...")
         
         try:
-            from app.frontend.components.data_display import clean_html_text
-            from app.frontend.utils.formatters import format_amount, format_date, get_round_color
+            from app.frontend.components.data_display import clean_html_text, _clean_short_text
+            from app.frontend.utils.formatters import format_amount, format_amount_series, format_date, format_funding_total, get_round_color
+            import pandas as pd
             
             # Test amount formatting with edge cases
             test_cases = [
                 (1000, "$1K"),
                 (1500000, "$1.5M"),
                 (2500000000, "$2.5B"),
+                # Ties round half-up; a value just under a boundary stays in the lower scale
+                (2500, "$3K"),
+                (1250000, "$1.3M"),
+                (999950000, "$1000.0M"),
                 (0, "Undisclosed"),
                 (None, "Undisclosed"),
-                ("invalid", "Undisclosed")
+                ("invalid", "Undisclosed"),
+                ([1], "Undisclosed"),
+                ({}, "Undisclosed")
             ]
             
             for amount, expected in test_cases:
@@ -175,8 +182,21 @@ class CyberPulseTest:
                     logger.error(f"❌ Amount formatting failed: {amount} -> {result} (expected {expected})")
                     return False
             
+            # The column formatter used by the table view must agree with the scalar one
+            amounts = pd.Series([amount for amount, _ in test_cases], dtype=object)
+            if list(format_amount_series(amounts)) != [expected for _, expected in test_cases]:
+                logger.error("❌ Column amount formatting disagrees with format_amount")
+                return False
+            
+            # Headline totals: billions to one decimal, millions whole, ties round half-up
+            total_cases = [(2_450_000_000, "$2.5B+"), (750_499_999, "$750M+"), (2_500_000, "$3M+"), (12_345, "$12,345+"), (None, "$0+")]
+            for total, expected in total_cases:
+                if format_funding_total(total) != expected:
+                    logger.error(f"❌ Funding total formatting failed: {total} -> {format_funding_total(total)} (expected {expected})")
+                    return False
+            
             # Test date formatting
-            test_dates = ["2024-01-15", "2023-12-31", "invalid-date", ""]
+            test_dates = ["2024-01-15", "2023-12-31", "invalid-date", "", ["x"]]
             for date_str in test_dates:
                 result = format_date(date_str)
                 if result:  # Should always return something
@@ -207,6 +227,17 @@ class CyberPulseTest:
                 logger.error("❌ HTML cleaning failed")
                 return False
             
+            # Label cleaning strips real tags only; bare comparisons and entity-encoded brackets are data
+            label_cases = [
+                ("a < b and c > d", "a < b and c > d"),
+                ("&lt;Series A&gt;", "<Series A>"),
+                ("<b>Acme</b> &amp; Co", "Acme & Co"),
+            ]
+            for label, expected in label_cases:
+                if _clean_short_text(label) != expected:
+                    logger.error(f"❌ Label cleaning failed: {label!r} -> {_clean_short_text(label)!r} (expected {expected!r})")
+                    return False
+            
             logger.info("✅ All UI component tests passed")
             return True
             